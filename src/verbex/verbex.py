@@ -2,73 +2,72 @@
 
 from __future__ import annotations
 
+import io
+import os
 import re
+import sys
+import warnings
 from collections.abc import Callable
-from collections.abc import Iterator
 from enum import Enum
+from functools import lru_cache
 from functools import wraps
+from typing import TYPE_CHECKING
 from typing import Annotated
 from typing import Any
+from typing import NoReturn
 from typing import TypeAlias
+from typing import TypeGuard
 from typing import Union
-from typing import cast
-from typing import runtime_checkable
 
-try:
-    from typing import Self
-except ImportError:
-    from typing_extensions import Self
+if TYPE_CHECKING:
+    if sys.version_info >= (3, 11):
+        from typing import Self
+    else:
+        from typing_extensions import Self
 
 from re import Pattern
 from typing import ParamSpec
-from typing import Protocol
 from typing import TypeVar
 
-from beartype import beartype
-from beartype.vale import Is
+# runtime type checking is opt-in, set VERBEX_TYPECHECK to 1, true or yes to
+# enable it. beartype is only imported when it is enabled.
+_TYPECHECK_ENV = os.environ.get("VERBEX_TYPECHECK", "").lower()
+_TYPECHECK = __debug__ and _TYPECHECK_ENV in {"1", "true", "yes"}
 
 
 def _string_len_is_1(text: object) -> bool:
     return isinstance(text, str) and len(text) == 1
 
 
-Char = Annotated[str, Is[_string_len_is_1]]
+if TYPE_CHECKING or _TYPECHECK:
+    from beartype.vale import Is
+
+    Char: TypeAlias = Annotated[str, Is[_string_len_is_1]]
+else:
+    Char: TypeAlias = str
 
 
 P = ParamSpec("P")
 R = TypeVar("R")
 
 
-# work around for bug https://github.com/python/mypy/issues/12660
-# fixed in next version of mypy.
-@runtime_checkable
-class HasIter(Protocol):
-    """Workaround for mypy P.args."""
-
-    def __iter__(self) -> Iterator[Any]:
-        """Object can be iterated.
+_typecheck: Callable[[Callable[P, R]], Callable[P, R]]
+if _TYPECHECK:
+    from beartype import beartype
 
-        Yields
-        ------
-            Next object.
+    _typecheck = beartype
+else:
+    _typecheck = lambda func: func  # noqa: E731
 
-        """
-        ...
 
+# same characters re.escape escapes, translated directly without its str/bytes
+# dispatch.
+_ESCAPE_TABLE = {char: "\\" + chr(char) for char in b"()[]{}?*+-|^$\\.&~# \t\n\r\v\f"}
 
-# work around for bug https://github.com/python/mypy/issues/12660
-# fixed in next version of mypy
-@runtime_checkable
-class HasItems(Protocol):
-    """Workaround for mypy P.kwargs."""
 
-    def items(self) -> tuple[str, Any]:
-        """Object has items method.
-
-        :returns: The dict of items.
-        :rtype: dict
-        """
-        ...
+@lru_cache(maxsize=1024)
+def _escape_cached(text: str) -> str:
+    return text.translate(_ESCAPE_TABLE)
 
 
 class EscapedText(str):
@@ -90,7 +89,11 @@ class EscapedText(str):
         :rtype: str
 
         """
-        return str.__new__(cls, re.escape(value))
+        return str.__new__(cls, _escape_cached(value))
+
+
+def _needs_escape(arg: object) -> TypeGuard[str]:
+    return isinstance(arg, str) and not isinstance(arg, (EscapedText, Enum))
 
 
 def re_escape(func: Callable[P, R]) -> Callable[P, R]:
@@ -105,26 +108,24 @@ def re_escape(func: Callable[P, R]) -> Callable[P, R]:
 
     @wraps(func)
     def inner(*args: P.args, **kwargs: P.kwargs) -> R:
-        escaped_args: list[Any] = []
-        escaped_kwargs: dict[str, Any] = {}
-        for arg in cast(HasIter, args):
-            if not isinstance(arg, EscapedText) and isinstance(arg, str):
-                escaped_args.append(EscapedText(arg))
-            else:
-                escaped_args.append(arg)
-        arg_k: str
-        arg_v: Any
-        for arg_k, arg_v in cast(HasItems, kwargs).items():
-            if not isinstance(arg_v, EscapedText) and isinstance(arg_v, str):
-                escaped_kwargs[arg_k] = EscapedText(str(arg_v))
-            else:
-                escaped_kwargs[arg_k] = arg_v
+        # fast path, nothing needs escaping so call through without copying.
+        if not any(_needs_escape(arg) for arg in args) and (
+            not kwargs or not any(_needs_escape(arg_v) for arg_v in kwargs.values())
+        ):
+            return func(*args, **kwargs)
+        escaped_args: list[Any] = [
+            EscapedText(arg) if _needs_escape(arg) else arg for arg in args
+        ]
+        escaped_kwargs: dict[str, Any] = {
+            arg_k: EscapedText(arg_v) if _needs_escape(arg_v) else arg_v
+            for arg_k, arg_v in kwargs.items()
+        }
         return func(*escaped_args, **escaped_kwargs)  # pyright: ignore[reportCallIssue]
 
     return inner
 
 
-class CharClass(Enum):
+class CharClass(str, Enum):
     """Enum of character classes in regex.
 
     :param Enum: Extends the Enum class.
@@ -132,6 +133,10 @@ class CharClass(Enum):
 
     """
 
+    # members are str, use the C level str methods directly.
+    __str__ = str.__str__
+    __format__ = str.__format__  # type: ignore[assignment]
+
     DIGIT = "\\d"
     LETTER = "\\w"
     UPPERCASE_LETTER = "\\u"
@@ -139,17 +144,8 @@ class CharClass(Enum):
     WHITESPACE = "\\s"
     TAB = "\\t"
 
-    def __str__(self) -> str:
-        """To string method based on Enum value.
-
-        :return: value of Enum
-        :rtype: str
-
-        """
-        return self.value
-
 
-class SpecialChar(Enum):
+class SpecialChar(str, Enum):
     """Enum of special characters, shorthand.
 
     :param Enum: Extends the Enum class.
@@ -157,20 +153,90 @@ class SpecialChar(Enum):
 
     """
 
+    __str__ = str.__str__
+    __format__ = str.__format__  # type: ignore[assignment]
+
     # does not work  / should not be used in [ ]
     LINEBREAK = "(\\n|(\\r\\n))"
     START_OF_LINE = "^"
     END_OF_LINE = "$"
     TAB = "\t"
 
-    def __str__(self) -> str:
-        """To string for special chars enum.
 
-        :return: Return value of enum as string.
-        :rtype: str
+# plain string constants for the argument-less builders.
+_START_OF_LINE = SpecialChar.START_OF_LINE.value
+_END_OF_LINE = SpecialChar.END_OF_LINE.value
+_LINEBREAK = SpecialChar.LINEBREAK.value
+_TAB = SpecialChar.TAB.value
+_ANYTHING = ".+"
+_AS_FEW = "?"
+_WORD = "(\\b\\w+\\b)"
 
-        """
-        return self.value
+
+def _digit_class(low: str, high: str) -> str:
+    if low == high:
+        return low
+    return f"[{low}-{high}]"
+
+
+def _same_length_range(low: str, high: str) -> list[str]:
+    """Return regex alternatives matching every number from low to high.
+
+    Both bounds must be non-negative and have the same number of digits.
+    """
+    if len(low) == 1:
+        return [_digit_class(low, high)]
+    if low[0] == high[0]:
+        return [low[0] + part for part in _same_length_range(low[1:], high[1:])]
+    rest = len(low) - 1
+    # [0-9] rather than \d, which also matches non-ASCII decimal digits.
+    any_rest = "[0-9]" if rest == 1 else f"[0-9]{{{rest}}}"
+    parts: list[str] = []
+    first_full = int(low[0])
+    if low[1:] != "0" * rest:
+        parts.extend(low[0] + part for part in _same_length_range(low[1:], "9" * rest))
+        first_full += 1
+    last_full = int(high[0])
+    if high[1:] != "9" * rest:
+        last_full -= 1
+    if first_full <= last_full:
+        parts.append(_digit_class(str(first_full), str(last_full)) + any_rest)
+    if high[1:] != "9" * rest:
+        parts.extend(
+            high[0] + part for part in _same_length_range("0" * rest, high[1:])
+        )
+    return parts
+
+
+def _non_negative_range_parts(start: int, end: int) -> list[str]:
+    """Return regex alternatives matching every integer from start to end.
+
+    Both bounds must be non-negative. Alternatives with more digits come first
+    so the longest number wins.
+    """
+    parts: list[str] = []
+    for length in range(len(str(end)), len(str(start)) - 1, -1):
+        low = max(start, 10 ** (length - 1) if length > 1 else 0)
+        high = min(end, 10**length - 1)
+        parts.extend(_same_length_range(str(low), str(high)))
+    return parts
+
+
+def _number_range_parts(start: int, end: int) -> list[str]:
+    """Return regex alternatives matching every integer from start to end.
+
+    Negative numbers are a ``-`` followed by the alternatives for their absolute
+    values; within each sign alternatives with more digits come first so the
+    longest number wins.
+    """
+    parts: list[str] = []
+    if start < 0:
+        parts.extend(
+            "-" + part for part in _non_negative_range_parts(max(-end, 1), -start)
+        )
+    if end >= 0:
+        parts.extend(_non_negative_range_parts(max(start, 0), end))
+    return parts
 
 
 CharClassOrChars: TypeAlias = str | CharClass
@@ -188,23 +254,41 @@ class Verbex:  # pylint: disable=too-many-public-methods
 
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_buf",
+        "_cached_str",
+        "_compiled",
+        "_frozen",
+        "_modifiers",
+    )
+
     EMPTY_REGEX_FLAG = re.RegexFlag(0)
 
-    @re_escape
-    @beartype
     def __init__(self, modifiers: re.RegexFlag = EMPTY_REGEX_FLAG) -> None:
         """Create a Verbex object; setting any needed flags.
 
         :param modifiers: Regex modifying flags (default: ``re.RegexFlag(0)``)
         :type modifiers: re.RegexFlag
 
+        :raises TypeError: If modifiers is not a re.RegexFlag.
+
         :returns: The created Verbex object.
         :rtype: Verbex
 
         """
-        # self._parts: List[str] = [text]
-        self._parts: list[str] = []
+        if not isinstance(modifiers, re.RegexFlag):
+            msg = "modifiers must be a re.RegexFlag"
+            raise TypeError(msg)
+        self._buf = io.StringIO()
         self._modifiers = modifiers
+        self._cached_str: str | None = None
+        self._compiled: Pattern[str] | None = None
+        self._frozen = False
+
+    def _raise_frozen(self) -> NoReturn:
+        msg = "cannot modify a Verbex object after build()"
+        raise ValueError(msg)
 
     @property
     def modifiers(self) -> re.RegexFlag:
@@ -223,57 +307,89 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: str
 
         """
-        return "".join(self._parts)
+        if self._cached_str is None:
+            self._cached_str = self._buf.getvalue()
+        return self._cached_str
 
-    @beartype
+    @_typecheck
     def _add(self, value: str | list[str]) -> Verbex:
         """Append a transformed value to internal expression to be compiled.
 
-        As possible, this method should be "private".
+        .. deprecated::
+            Use ``_add_str`` or ``_add_many`` instead.
 
         :return: Modified Verbex object.
         :rtype: Verbex
 
         """
+        warnings.warn(
+            "Verbex._add is deprecated, use _add_str or _add_many instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         if isinstance(value, list):
-            self._parts.extend(value)
-        else:
-            self._parts.append(value)
+            return self._add_many(value)
+        return self._add_str(value)
+
+    def _add_str(self, value: str) -> Verbex:
+        """Append a single transformed string to the internal expression.
+
+        :return: Modified Verbex object.
+        :rtype: Verbex
+
+        """
+        if self._frozen:
+            self._raise_frozen()
+        self._buf.write(value)
+        self._cached_str = None
+        self._compiled = None
+        return self
+
+    def _add_many(self, values: list[str]) -> Verbex:
+        """Append several transformed strings to the internal expression.
+
+        :return: Modified Verbex object.
+        :rtype: Verbex
+
+        """
+        if self._frozen:
+            self._raise_frozen()
+        self._buf.writelines(values)
+        self._cached_str = None
+        self._compiled = None
         return self
 
     def regex(self) -> Pattern[str]:
         """Get a regular expression object.
 
+        The compiled pattern is cached until the Verbex object is modified.
+
         :return: A regular expression object.
         :rtype: Pattern[str]
 
         """
-        return re.compile(
-            str(self),
-            self._modifiers,
-        )
+        if self._compiled is None:
+            self._compiled = re.compile(
+                str(self),
+                self._modifiers,
+            )
+        return self._compiled
 
-    # allow VerbexEscapedCharClassOrSpecial
+    def build(self) -> Pattern[str]:
+        """Compile the expression and freeze this Verbex object.
 
-    @re_escape
-    @beartype
-    def _capture_group_with_name(
-        self,
-        name: str,
-        text: VerbexEscapedCharClassOrSpecial,
-    ) -> Verbex:
-        return self._add(f"(?<{name}>{text!s})")
+        After building, any further modification raises ``ValueError``.
 
-    @re_escape
-    @beartype
-    def _capture_group_without_name(
-        self,
-        text: VerbexEscapedCharClassOrSpecial,
-    ) -> Verbex:
-        return self._add(f"({text!s})")
+        :return: The compiled regular expression object.
+        :rtype: Pattern[str]
+
+        """
+        pattern = self.regex()
+        self._frozen = True
+        return pattern
 
     @re_escape
-    @beartype
+    @_typecheck
     def capture_group(
         self,
         name_or_text: str | None | VerbexEscapedCharClassOrSpecial = None,
@@ -294,17 +410,18 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        if name_or_text is not None:
-            if text is None:
-                _text = name_or_text
-                return self._capture_group_without_name(_text)
-            if isinstance(name_or_text, str):
-                return self._capture_group_with_name(name_or_text, text)
-        msg = "text must be specified with optional name"
-        raise ValueError(msg)
+        if name_or_text is None or (
+            text is not None
+            and (not isinstance(name_or_text, str) or isinstance(name_or_text, Enum))
+        ):
+            msg = "text must be specified with optional name"
+            raise ValueError(msg)
+        if text is None:
+            return self._add_str("(" + str(name_or_text) + ")")
+        return self._add_str("(?<" + str(name_or_text) + ">" + str(text) + ")")
 
     @re_escape
-    @beartype
+    @_typecheck
     def OR(self, text: VerbexEscapedCharClassOrSpecial) -> Verbex:  # noqa: N802
         """`or` is a python keyword so we use `OR` instead.
 
@@ -315,10 +432,10 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self._add("|").find(text)
+        return self._add_str("|" + str(text))
 
     @re_escape
-    @beartype
+    @_typecheck
     def zero_or_more(self, text: VerbexEscapedCharClassOrSpecial) -> Verbex:
         """Find the text or Verbex object zero or more times.
 
@@ -329,10 +446,10 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self._add(f"(?:{text!s})*")
+        return self._add_str("(?:" + str(text) + ")*")
 
     @re_escape
-    @beartype
+    @_typecheck
     def one_or_more(self, text: VerbexEscapedCharClassOrSpecial) -> Verbex:
         """Find the text or Verbex object one or more times.
 
@@ -343,10 +460,10 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self._add(f"(?:{text!s})+")
+        return self._add_str("(?:" + str(text) + ")+")
 
     @re_escape
-    @beartype
+    @_typecheck
     def n_times(
         self,
         text: VerbexEscapedCharClassOrSpecial,
@@ -360,10 +477,10 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self._add(f"(?:{text!s}){{{n}}}")
+        return self._add_str("(?:" + str(text) + "){" + str(n) + "}")
 
     @re_escape
-    @beartype
+    @_typecheck
     def n_times_or_more(
         self,
         text: VerbexEscapedCharClassOrSpecial,
@@ -377,10 +494,10 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self._add(f"(?:{text!s}){{{n},}}")
+        return self._add_str("(?:" + str(text) + "){" + str(n) + ",}")
 
     @re_escape
-    @beartype
+    @_typecheck
     def n_to_m_times(
         self,
         text: VerbexEscapedCharClassOrSpecial,
@@ -399,10 +516,10 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self._add(f"(?:{text!s}){{{n},{m}}}")
+        return self._add_str("(?:" + str(text) + "){" + str(n) + "," + str(m) + "}")
 
     @re_escape
-    @beartype
+    @_typecheck
     def maybe(self, text: VerbexEscapedCharClassOrSpecial) -> Verbex:
         """Possibly find the text / Verbex object.
 
@@ -413,10 +530,10 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self._add(f"(?:{text!s})?")
+        return self._add_str("(?:" + str(text) + ")?")
 
     @re_escape
-    @beartype
+    @_typecheck
     def find(self, text: VerbexEscapedCharClassOrSpecial) -> Verbex:
         """Find the text or Verbex object.
 
@@ -427,10 +544,10 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self._add(str(text))
+        return self._add_str(str(text))
 
     @re_escape
-    @beartype
+    @_typecheck
     def then(self, text: VerbexEscapedCharClassOrSpecial) -> Verbex:
         """Synonym for find.
 
@@ -441,10 +558,10 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self.find(text)
+        return self._add_str(str(text))
 
     @re_escape
-    @beartype
+    @_typecheck
     def followed_by(self, text: VerbexEscapedCharClassOrSpecial) -> Verbex:
         """Match if string is followed by text.
 
@@ -454,10 +571,10 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self._add(f"(?={text})")
+        return self._add_str("(?=" + str(text) + ")")
 
     @re_escape
-    @beartype
+    @_typecheck
     def not_followed_by(self, text: VerbexEscapedCharClassOrSpecial) -> Verbex:
         """Match if string is not followed by text.
 
@@ -467,10 +584,10 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self._add(f"(?!{text})")
+        return self._add_str("(?!" + str(text) + ")")
 
     @re_escape
-    @beartype
+    @_typecheck
     def preceded_by(self, text: VerbexEscapedCharClassOrSpecial) -> Verbex:
         """Match if string is not preceded by text.
 
@@ -480,10 +597,10 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self._add(f"(?<={text})")
+        return self._add_str("(?<=" + str(text) + ")")
 
     @re_escape
-    @beartype
+    @_typecheck
     def not_preceded_by(self, text: VerbexEscapedCharClassOrSpecial) -> Verbex:
         """Match if string is not preceded by text.
 
@@ -493,10 +610,10 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self._add(f"(?<!{text})")
+        return self._add_str("(?<!" + str(text) + ")")
 
     @re_escape
-    @beartype
+    @_typecheck
     def any_of(self, chargroup: CharClassOrChars) -> Verbex:
         """Find anything in this group of chars or char class.
 
@@ -507,10 +624,10 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self._add(f"(?:[{chargroup}])")
+        return self._add_str("(?:[" + str(chargroup) + "])")
 
     @re_escape
-    @beartype
+    @_typecheck
     def not_any_of(self, text: CharClassOrChars) -> Verbex:
         """Find anything but this group of chars or char class.
 
@@ -521,7 +638,7 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self._add(f"(?:[^{text}])")
+        return self._add_str("(?:[^" + str(text) + "])")
 
     @re_escape
     def anything_but(self, chargroup: EscapedCharClassOrSpecial) -> Verbex:
@@ -534,7 +651,7 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self._add(f"[^{chargroup}]+")
+        return self._add_str("[^" + str(chargroup) + "]+")
 
     # no text input
 
@@ -545,7 +662,7 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self.find(SpecialChar.START_OF_LINE)
+        return self._add_str(_START_OF_LINE)
 
     def end_of_line(self) -> Verbex:
         """Find the end of the line.
@@ -554,7 +671,7 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self.find(SpecialChar.END_OF_LINE)
+        return self._add_str(_END_OF_LINE)
 
     def line_break(self) -> Verbex:
         """Find a line break.
@@ -563,7 +680,7 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self.find(SpecialChar.LINEBREAK)
+        return self._add_str(_LINEBREAK)
 
     def tab(self) -> Verbex:
         """Find a tab.
@@ -572,7 +689,7 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self.find(SpecialChar.TAB)
+        return self._add_str(_TAB)
 
     def anything(self) -> Verbex:
         """Find anything one or more times.
@@ -581,7 +698,7 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self._add(".+")
+        return self._add_str(_ANYTHING)
 
     def as_few(self) -> Verbex:
         """Modify previous search to not be greedy.
@@ -590,9 +707,9 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self._add("?")
+        return self._add_str(_AS_FEW)
 
-    @beartype
+    @_typecheck
     def number_range(self, start: int, end: int) -> Verbex:
         """Generate a range of numbers.
 
@@ -600,13 +717,18 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :type start: int
         :param end: End of the range
         :type end: int
+        :raises ValueError: If start is greater than end.
+
         :return: Modified Verbex object.
         :rtype: Verbex
 
         """
-        return self._add("(?:" + "|".join(str(i) for i in range(start, end + 1)) + ")")
+        if start > end:
+            msg = "start of the range must not be greater than the end"
+            raise ValueError(msg)
+        return self._add_str("(?:" + "|".join(_number_range_parts(start, end)) + ")")
 
-    @beartype
+    @_typecheck
     def letter_range(self, start: Char, end: Char) -> Verbex:
         """Generate a range of letters.
 
@@ -618,7 +740,7 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self._add(f"[{start}-{end}]")
+        return self._add_str(f"[{start}-{end}]")
 
     def word(self) -> Verbex:
         """Find a word on word boundary.
@@ -627,10 +749,18 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        return self._add("(\\b\\w+\\b)")
+        return self._add_str(_WORD)
 
     # # --------------- modifiers ------------------------
 
+    def _add_modifier(self, flag: re.RegexFlag) -> Verbex:
+        if self._frozen:
+            self._raise_frozen()
+        self._modifiers |= flag
+        # flags do not change the pattern text, so the cached string stays valid.
+        self._compiled = None
+        return self
+
     def with_any_case(self) -> Verbex:
         """Modify Verbex object to be case insensitive.
 
@@ -638,8 +768,7 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        self._modifiers |= re.IGNORECASE
-        return self
+        return self._add_modifier(re.IGNORECASE)
 
     def search_by_line(self) -> Verbex:
         """Search each line, ^ and $ match beginning and end of line respectively.
@@ -648,8 +777,7 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        self._modifiers |= re.MULTILINE
-        return self
+        return self._add_modifier(re.MULTILINE)
 
     def with_ascii(self) -> Verbex:
         """Match ascii instead of unicode.
@@ -658,8 +786,7 @@ class Verbex:  # pylint: disable=too-many-public-methods
         :rtype: Verbex
 
         """
-        self._modifiers |= re.ASCII
-        return self
+        return self._add_modifier(re.ASCII)
 
 
 # left over notes from original version
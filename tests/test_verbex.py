@@ -2,8 +2,13 @@
 # flake8: noqa
 # type: ignore
 # pylint: disable-all
+import importlib
+import os
 import re
+import sys
 import unittest
+import weakref
+from unittest import mock
 
 from verbex import CharClass, SpecialChar, Verbex
 
@@ -20,10 +25,49 @@ class verbexTest(unittest.TestCase):
     #     # self.exp = None
 
     def test_should_render_verbex_as_string(self):
-        self.assertEqual(str(Verbex()._add("^$")), "^$")
+        self.assertEqual(str(Verbex()._add_str("^$")), "^$")
+
+    def _import_with_typecheck(self, value):
+        saved = {
+            name: sys.modules.pop(name)
+            for name in ("verbex", "verbex.verbex")
+            if name in sys.modules
+        }
+        try:
+            with mock.patch.dict(os.environ, {"VERBEX_TYPECHECK": value}):
+                return importlib.import_module("verbex.verbex")
+        finally:
+            sys.modules.update(saved)
+
+    def test_typecheck_opt_in_rejects_bad_arguments(self):
+        from beartype.roar import BeartypeCallHintParamViolation
+
+        for value in ("1", "true", "YES"):
+            checked = self._import_with_typecheck(value)
+            with self.assertRaises(BeartypeCallHintParamViolation):
+                checked.Verbex().letter_range("ab", "c")
+            with self.assertRaises(TypeError):
+                checked.Verbex(2)
+
+    def test_typecheck_stays_off_for_other_values(self):
+        for value in ("0", "false", "no", ""):
+            unchecked = self._import_with_typecheck(value)
+            self.assertEqual(
+                str(unchecked.Verbex().letter_range("ab", "c")),
+                "[ab-c]",
+            )
+
+    def test_add_is_deprecated(self):
+        with self.assertWarns(DeprecationWarning):
+            Verbex()._add("^")
+
+    def test_should_reject_non_flag_modifiers(self):
+        self.assertEqual(Verbex(re.IGNORECASE).modifiers, re.IGNORECASE)
+        with self.assertRaises(TypeError):
+            Verbex(2)
 
     def test_should_render_verbex_list_as_string(self):
-        self.assertEqual(str(Verbex()._add(["^", "[0-9]", "$"])), "^[0-9]$")
+        self.assertEqual(str(Verbex()._add_many(["^", "[0-9]", "$"])), "^[0-9]$")
 
     def test_should_match_characters_in_range(self):
         regex = Verbex().letter_range("a", "c").regex()
@@ -34,6 +78,43 @@ class verbexTest(unittest.TestCase):
         regex = Verbex().letter_range("a", "c").regex()
         self.assertNotRegex("d", regex)
 
+    def test_should_match_numbers_in_range(self):
+        for start, end in [(0, 9), (1, 999), (12, 345), (99, 101), (7, 2024)]:
+            regex = Verbex().number_range(start, end).regex()
+            for number in range(0, 2100):
+                self.assertEqual(
+                    regex.fullmatch(str(number)) is not None,
+                    start <= number <= end,
+                )
+
+    def test_should_build_compact_number_range(self):
+        self.assertEqual(
+            str(Verbex().number_range(1, 999)),
+            "(?:[1-9][0-9]{2}|[1-9][0-9]|[1-9])",
+        )
+
+    def test_number_range_rejects_non_ascii_digits(self):
+        regex = Verbex().number_range(0, 999).regex()
+        self.assertIsNone(regex.fullmatch("1\u0662"))
+        self.assertIsNone(regex.fullmatch("\u0665"))
+        self.assertIsNotNone(regex.fullmatch("12"))
+
+    def test_should_match_negative_numbers_in_range(self):
+        for start, end in [(-3, 12), (-120, -7), (-1000, 1000)]:
+            regex = Verbex().number_range(start, end).regex()
+            for number in range(-1100, 1100):
+                self.assertEqual(
+                    regex.fullmatch(str(number)) is not None,
+                    start <= number <= end,
+                )
+        regex = Verbex().number_range(-3, 12).regex()
+        self.assertEqual(regex.search("x 12").group(), "12")
+        self.assertEqual(regex.search("x -3").group(), "-3")
+
+    def test_number_range_start_greater_than_end(self):
+        with self.assertRaises(ValueError):
+            Verbex().number_range(5, 1)
+
     def test_should_match_start_of_line(self):
         regex = Verbex().find(SpecialChar.START_OF_LINE).find("text ").regex()
         self.assertRegex("text ", regex)
@@ -53,6 +134,9 @@ class verbexTest(unittest.TestCase):
         self.assertRegex("Y Files", regex)
         self.assertNotRegex("X Files", regex)
 
+    def test_anything_but_accepts_verbex(self):
+        self.assertEqual(str(Verbex().anything_but(Verbex().find("a"))), "[^a]+")
+
     def test_should_not_match_anything_but_specified_element_when_specified_element_is_found(
         self,
     ):
@@ -301,6 +385,104 @@ class verbexTest(unittest.TestCase):
         self.assertNotRegex("!:", regex)
         self.assertRegex("! :", regex)
 
+    def test_find_escapes_like_re_escape(self):
+        text = "a.b*c (d) [e] {f} ^$ | \\ ? + - & ~ # \t\n"
+        self.assertEqual(str(Verbex().find(text)), re.escape(text))
+
+    def test_enum_members_render_as_their_value(self):
+        self.assertEqual(str(CharClass.DIGIT), "\\d")
+        self.assertEqual(f"{SpecialChar.START_OF_LINE}", "^")
+        self.assertEqual(str(Verbex().find(CharClass.DIGIT)), "\\d")
+        self.assertEqual(str(Verbex().any_of(CharClass.DIGIT)), "(?:[\\d])")
+
+    def test_verbex_has_no_instance_dict(self):
+        verbex = Verbex()
+        with self.assertRaises(AttributeError):
+            verbex.unknown = 1
+
+    def test_verbex_supports_weak_references(self):
+        verbex = Verbex().find("a")
+        self.assertIs(weakref.ref(verbex)(), verbex)
+
+    def test_string_is_cached_until_modified(self):
+        verbex = Verbex().find("a").find("b")
+        text = str(verbex)
+        self.assertIs(text, str(verbex))
+        verbex.with_any_case()
+        self.assertIs(text, str(verbex))
+        verbex.find("c")
+        self.assertEqual(str(verbex), "abc")
+
+    def test_regex_is_cached_until_modified(self):
+        verbex = Verbex().find("a")
+        regex = verbex.regex()
+        self.assertIs(regex, verbex.regex())
+        verbex.find("b")
+        self.assertIsNot(regex, verbex.regex())
+        self.assertEqual(verbex.regex().pattern, "ab")
+
+    def test_regex_cache_is_reset_by_modifiers(self):
+        verbex = Verbex().find("THOR")
+        self.assertNotRegex("thor", verbex.regex())
+        verbex.with_any_case()
+        self.assertRegex("thor", verbex.regex())
+
+    def test_capture_group(self):
+        regex = Verbex().capture_group(Verbex().find("a.")).regex()
+        self.assertEqual(regex.pattern, "(a\\.)")
+        self.assertEqual(regex.search("xa.").group(1), "a.")
+        self.assertEqual(
+            str(Verbex().capture_group("name", CharClass.DIGIT)),
+            "(?<name>\\d)",
+        )
+
+    def test_capture_group_requires_text(self):
+        with self.assertRaises(ValueError):
+            Verbex().capture_group()
+        with self.assertRaises(ValueError):
+            Verbex().capture_group(Verbex().find("a"), "b")
+        with self.assertRaises(ValueError):
+            Verbex().capture_group(CharClass.DIGIT, "x")
+
+    def test_build_returns_compiled_pattern(self):
+        verbex = Verbex().find("bird")
+        regex = verbex.build()
+        self.assertIs(regex, verbex.regex())
+        self.assertEqual(regex.sub("duck", "Replace bird"), "Replace duck")
+
+    def test_should_not_modify_after_build(self):
+        verbex = Verbex().find("bird")
+        verbex.build()
+        with self.assertRaises(ValueError):
+            verbex.find("duck")
+        with self.assertRaises(ValueError):
+            verbex.with_any_case()
+        self.assertEqual(str(verbex), "bird")
+
+    def test_pattern_attributes_not_forwarded(self):
+        verbex = Verbex().find("bird")
+        verbex.build()
+        with self.assertRaises(AttributeError):
+            verbex.sub  # noqa: B018
+
+    def test_lookarounds_with_verbex_and_char_class(self):
+        self.assertEqual(
+            str(Verbex().followed_by(Verbex().find("a.b"))),
+            "(?=a\\.b)",
+        )
+        self.assertEqual(
+            str(Verbex().not_followed_by(CharClass.DIGIT)),
+            "(?!\\d)",
+        )
+        self.assertEqual(
+            str(Verbex().preceded_by(Verbex().find("$"))),
+            "(?<=\\$)",
+        )
+        self.assertEqual(
+            str(Verbex().not_preceded_by(CharClass.WHITESPACE)),
+            "(?<!\\s)",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()